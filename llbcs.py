@@ -25,22 +25,37 @@ Profile byte meanings (partial):
   byte1=Stamina, byte2=Quality/Movement, byte3=Tune(0–15), byte6=Displayed Pitch skill(0–4), byte7=Mult(00/02)
 """
 from __future__ import annotations
+from contextlib import contextmanager
 from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Optional, Tuple
+import mmap
 import os
+import shutil
+import struct
+
+try:
+    import numpy as np  # optional: vectorised IPS diff
+except ImportError:
+    np = None
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QFileDialog, QTableWidget, QTableWidgetItem, QComboBox,
-    QMessageBox, QSpinBox, QTabWidget, QFrame
+    QMessageBox, QSpinBox, QTabWidget, QFrame, QStyledItemDelegate, QAbstractItemView
 )
-from PySide6.QtGui import QColor, QPalette
+from PySide6.QtGui import QColor, QPalette, QStandardItem, QStandardItemModel
+from PySide6.QtCore import Qt
 
 NAME_LEN = 6
 ROW_LEN  = 16
+_FF16    = b"\xff" * ROW_LEN   # all-FF padding line that ends a roster
+_ROW_STRUCT = struct.Struct("<6s10B")   # name6 + bytes 6..15 of a player row
 
 # --- Team offsets (roster start) ---
-TEAM_OFFSETS = {
+TEAM_OFFSETS = MappingProxyType({
     "Japan":         0x10430,
     "Arizona":       0x10550,
     "Pennsylvania":  0x10670,
@@ -57,10 +72,10 @@ TEAM_OFFSETS = {
     "Italy":         0x112D0,
     "Illinois":      0x113F0,
     "Florida":       0x11510,
-}
+})
 
 # --- Team color offsets (two bytes per team: primary, secondary) ---
-TEAM_OFFSETS_COLOUR = {
+TEAM_OFFSETS_COLOUR = MappingProxyType({
     "Japan":         0x1FAD0,
     "Arizona":       0x1FAD3,
     "Pennsylvania":  0x1FAD6,
@@ -77,27 +92,17 @@ TEAM_OFFSETS_COLOUR = {
     "Italy":         0x1FAF7,
     "Illinois":      0x1FAFA,
     "Florida":       0x1FAFD,
-}
+})
 
-# --- Lineup (positions/batting order) addresses per team (9 bytes each) ---
-TEAM_LINEUP_ADDRS = {
-    "Japan":        [0x116DA,0x116DB,0x116DC,0x116DD,0x116DE,0x116DF,0x116E0,0x116E1,0x116E2],
-    "Arizona":      [0x116E3,0x116E4,0x116E5,0x116E6,0x116E7,0x116E8,0x116E9,0x116EA,0x116EB],
-    "Pennsylvania": [0x116EC,0x116ED,0x116EE,0x116EF,0x116F0,0x116F1,0x116F2,0x116F3,0x116F4],
-    "Chinese Taipei":[0x116F5,0x116F6,0x116F7,0x116F8,0x116F9,0x116FA,0x116FB,0x116FC,0x116FD],
-    "Korea":        [0x116FE,0x116FF,0x11700,0x11701,0x11702,0x11703,0x11704,0x11705,0x11706],
-    "New York":     [0x11707,0x11708,0x11709,0x1170A,0x1170B,0x1170C,0x1170D,0x1170E,0x1170F],
-    "California":   [0x11710,0x11711,0x11712,0x11713,0x11714,0x11715,0x11716,0x11717,0x11718],
-    "Texas":        [0x11719,0x1171A,0x1171B,0x1171C,0x1171D,0x1171E,0x1171F,0x11720,0x11721],
-    "Hawaii":       [0x11722,0x11723,0x11724,0x11725,0x11726,0x11727,0x11728,0x11729,0x1172A],
-    "Spain":        [0x1172B,0x1172C,0x1172D,0x1172E,0x1172F,0x11730,0x11731,0x11732,0x11733],
-    "Puerto Rico":  [0x11734,0x11735,0x11736,0x11737,0x11738,0x11739,0x1173A,0x1173B,0x1173C],
-    "Mexico":       [0x1173D,0x1173E,0x1173F,0x11740,0x11741,0x11742,0x11743,0x11744,0x11745],
-    "Canada":       [0x11746,0x11747,0x11748,0x11749,0x1174A,0x1174B,0x1174C,0x1174D,0x1174E],
-    "Italy":        [0x1174F,0x11750,0x11751,0x11752,0x11753,0x11754,0x11755,0x11756,0x11757],
-    "Illinois":     [0x11758,0x11759,0x1175A,0x1175B,0x1175C,0x1175D,0x1175E,0x1175F,0x11760],
-    "Florida":      [0x11761,0x11762,0x11763,0x11764,0x11765,0x11766,0x11767,0x11768,0x11769],
-}
+# Team index (TEAM_OFFSETS order) -> offsets, so one lookup serves every table
+_TEAM_INDEX   = MappingProxyType({name: i for i, name in enumerate(TEAM_OFFSETS)})
+_ROSTER_START = tuple(TEAM_OFFSETS.values())
+_COLOR_OFF    = tuple(TEAM_OFFSETS_COLOUR[name] for name in TEAM_OFFSETS)
+
+# --- Lineup (positions/batting order): 9 bytes per team, teams back to back
+# in TEAM_OFFSETS order starting at _LINEUP_BASE ---
+_LINEUP_BASE = 0x116DA
+_LINEUP_LEN  = 9
 
 # Body mapping (byte 6)
 BODY_TYPE_MAP = {
@@ -110,35 +115,53 @@ BODY_TYPE_MAP = {
 }
 SIZE_FROM_CODE = {0: "Tall", 1: "Fat", 2: "Short"}
 CODE_FROM_SIZE = {v: k for k, v in SIZE_FROM_CODE.items()}
+_BODY_CODE = {(bat, size): code | (0x80 if bat == "Left" else 0)
+              for bat in ("Right", "Left") for size, code in CODE_FROM_SIZE.items()}
+
+# Pitcher profile byte 0: top bit = hand, low nibble = delivery
+class Hand(IntEnum):
+    RIGHT = 0x00
+    LEFT  = 0x80
+
+class Delivery(IntEnum):
+    NORMAL  = 0
+    HARD    = 1
+    SIDEARM = 2
+
+HAND_LABELS = {Hand.RIGHT: "Right", Hand.LEFT: "Left"}
+DELIVERY_FROM_CODE = {Delivery.NORMAL: "Normal", Delivery.HARD: "Hard", Delivery.SIDEARM: "Sidearm"}
+
 PI_CHOICES   = [0x00, 0x08, 0x10, 0x18]
 CONST14_CHOICES = [0x00, 0x02, 0x03, 0x04]
+MULT_CHOICES = [0x00, 0x02]
+_PI_SET  = frozenset(PI_CHOICES)
 
 # Position labels
 POS_LIST = ["P","C","1B","2B","3B","SS","LF","CF","RF"]
 POS_TO_IDX = {name:i for i,name in enumerate(POS_LIST)}
 
-# NES LLB palette: value is HSV as "H,S,V"
+# NES LLB palette: value is HSV as (H, S, V)
 LLB_COLOR_PALETTE_MAP = {
-    0x00: "0,0,116", 0x01: "246,211,140", 0x02: "240,255,168", 0x03: "266,255,156",
-    0x04: "310,255,140", 0x05: "354,255,168", 0x06: "0,255,164", 0x07: "3,255,124",
-    0x08: "41,255,64", 0x09: "120,255,68", 0x0A: "120,255,80", 0x0B: "140,255,60",
-    0x0C: "208,188,92", 0x0D: "0,0,0", 0x0E: "0,0,0", 0x0F: "0,0,0",
-    0x10: "0,0,188", 0x11: "211,255,236", 0x12: "232,220,236", 0x13: "272,255,240",
-    0x14: "300,255,188", 0x15: "336,255,228", 0x16: "11,255,216", 0x17: "20,240,200",
-    0x18: "49,255,136", 0x19: "120,255,148", 0x1A: "120,255,168", 0x1B: "143,255,144",
-    0x1C: "183,255,136", 0x1D: "0,0,0", 0x1E: "0,0,0", 0x1F: "0,0,0",
-    0x20: "0,0,252", 0x21: "200,194,252", 0x22: "219,162,252", 0x23: "275,117,252",
-    0x24: "296,134,252", 0x25: "331,138,252", 0x26: "7,158,252", 0x27: "29,198,252",
-    0x28: "42,191,240", 0x29: "85,235,208", 0x2A: "118,172,220", 0x2B: "144,165,248",
-    0x2C: "175,255,232", 0x2D: "0,0,120", 0x2E: "0,0,0", 0x2F: "0,0,0",
-    0x30: "0,0,252", 0x31: "197,85,252", 0x32: "222,57,252", 0x33: "253,53,252",
-    0x34: "300,57,252", 0x35: "338,57,252", 0x36: "9,77,252", 0x37: "34,85,252",
-    0x38: "44,93,252", 0x39: "78,93,252", 0x3A: "136,77,240", 0x3B: "142,77,252",
-    0x3C: "172,97,252", 0x3D: "0,0,196", 0x3E: "0,0,0", 0x3F: "0,0,0",
+    0x00: (0,0,116), 0x01: (246,211,140), 0x02: (240,255,168), 0x03: (266,255,156),
+    0x04: (310,255,140), 0x05: (354,255,168), 0x06: (0,255,164), 0x07: (3,255,124),
+    0x08: (41,255,64), 0x09: (120,255,68), 0x0A: (120,255,80), 0x0B: (140,255,60),
+    0x0C: (208,188,92), 0x0D: (0,0,0), 0x0E: (0,0,0), 0x0F: (0,0,0),
+    0x10: (0,0,188), 0x11: (211,255,236), 0x12: (232,220,236), 0x13: (272,255,240),
+    0x14: (300,255,188), 0x15: (336,255,228), 0x16: (11,255,216), 0x17: (20,240,200),
+    0x18: (49,255,136), 0x19: (120,255,148), 0x1A: (120,255,168), 0x1B: (143,255,144),
+    0x1C: (183,255,136), 0x1D: (0,0,0), 0x1E: (0,0,0), 0x1F: (0,0,0),
+    0x20: (0,0,252), 0x21: (200,194,252), 0x22: (219,162,252), 0x23: (275,117,252),
+    0x24: (296,134,252), 0x25: (331,138,252), 0x26: (7,158,252), 0x27: (29,198,252),
+    0x28: (42,191,240), 0x29: (85,235,208), 0x2A: (118,172,220), 0x2B: (144,165,248),
+    0x2C: (175,255,232), 0x2D: (0,0,120), 0x2E: (0,0,0), 0x2F: (0,0,0),
+    0x30: (0,0,252), 0x31: (197,85,252), 0x32: (222,57,252), 0x33: (253,53,252),
+    0x34: (300,57,252), 0x35: (338,57,252), 0x36: (9,77,252), 0x37: (34,85,252),
+    0x38: (44,93,252), 0x39: (78,93,252), 0x3A: (136,77,240), 0x3B: (142,77,252),
+    0x3C: (172,97,252), 0x3D: (0,0,196), 0x3E: (0,0,0), 0x3F: (0,0,0),
 }
 
 # ---- Data classes ----
-@dataclass
+@dataclass(slots=True)
 class Player:
     name: str
     body_type: int   # byte6
@@ -150,26 +173,26 @@ class Player:
     const14: int     # byte14
     row_offset: int
 
-@dataclass
+@dataclass(slots=True)
 class PitchProfile:
     offset: int         # absolute ROM offset of first byte of the 8-byte profile
     raw: bytearray      # exactly 8 bytes
 
     @property
-    def hand(self) -> str:
-        return "Left" if (self.raw[0] & 0x80) else "Right"
+    def hand(self) -> Hand:
+        return Hand(self.raw[0] & 0x80)
     @hand.setter
-    def hand(self, val: str):
-        self.raw[0] = (self.raw[0] & 0x7F) | (0x80 if val == "Left" else 0)
+    def hand(self, val: int):
+        self.raw[0] = (self.raw[0] & 0x7F) | (val & 0x80)
 
     @property
-    def delivery(self) -> str:
+    def delivery(self) -> int:
+        # A Delivery member, or the raw nibble if the ROM holds an unlisted code
         low = self.raw[0] & 0x0F
-        return {0: "Normal", 1: "Hard", 2: "Sidearm"}.get(low, f"0x{low:02X}")
+        return Delivery(low) if low in DELIVERY_FROM_CODE else low
     @delivery.setter
-    def delivery(self, val: str):
-        low = {"Normal":0, "Hard":1, "Sidearm":2}.get(val, 0)
-        self.raw[0] = (self.raw[0] & 0xF0) | low
+    def delivery(self, val: int):
+        self.raw[0] = (self.raw[0] & 0xF0) | (val & 0x0F)
 
     @property
     def stamina(self) -> int: return self.raw[1]
@@ -196,17 +219,56 @@ class PitchProfile:
     @mult.setter
     def mult(self, v: int): self.raw[7] = v & 0xFF
 
+@lru_cache(maxsize=512)
+def _encode_name6(s: str) -> bytes:
+    return (s or '').upper()[:NAME_LEN].encode('ascii', 'ignore').ljust(NAME_LEN, b' ')
+
 # ---- Model ----
 class RosterModel:
     def __init__(self, rom_path: str, start_offset: int):
         self.rom_path = rom_path
-        with open(rom_path, 'rb') as f:
-            self.buf = bytearray(f.read())
+        self._map_rom()
         self.start = start_offset
-        self.players: List[Player] = []
-        self.profiles: List[PitchProfile] = []
-        self._parse_team()
-        self._parse_profiles()
+        # Players and profiles are parsed on first access; colour/lineup edits never need them
+        self._players: Optional[List[Player]] = None
+        self._profiles: Optional[List[PitchProfile]] = None
+        self._dirty: List[Tuple[int, int]] = []   # (start, end) spans written since load
+        # Roster terminator, found once and shared by both parsers
+        self._ff_line = self._find_ff_line_after_team(window=len(self.buf))
+
+    @property
+    def players(self) -> List[Player]:
+        if self._players is None:
+            self._parse_team()
+        return self._players
+    @players.setter
+    def players(self, players: List[Player]):
+        self._players = players
+
+    @property
+    def profiles(self) -> List[PitchProfile]:
+        if self._profiles is None:
+            self._parse_profiles()
+        return self._profiles
+    @profiles.setter
+    def profiles(self, profiles: List[PitchProfile]):
+        self._profiles = profiles
+
+    def _map_rom(self) -> None:
+        with open(self.rom_path, 'rb') as f:
+            # Copy-on-write: pages load on demand and edits never reach the file
+            self.buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            # Read-only view of the same file: the base for IPS diffs, no second read
+            self.orig = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Zero-copy view for reads; writes still go through self.buf
+        self._mv = memoryview(self.buf)
+
+    def close(self) -> None:
+        """Release the ROM mappings; the model is unusable afterwards."""
+        self._mv.release()
+        self.buf.close()
+        if isinstance(self.orig, mmap.mmap):
+            self.orig.close()
 
     # --- Lineup byte encoding (per your correction) ---
     @staticmethod
@@ -233,155 +295,179 @@ class RosterModel:
 
     # --- Helpers ---
     @staticmethod
-    def _encode_name6(s: str) -> bytes:
-        s = (s or '').upper()[:NAME_LEN]
-        b = s.encode('ascii', 'ignore')
-        if len(b) < NAME_LEN:
-            b += b" " * (NAME_LEN - len(b))
-        return b
-
-    def _parse_player(self, chunk: bytes, offset: int) -> Optional[Player]:
-        if len(chunk) != ROW_LEN:
-            return None
-        name_b = chunk[:NAME_LEN]
+    def _parse_player(fields: tuple, offset: int) -> Player:
+        name_b, body_type, _b7, unk8, arm, speed, hit, pi, _b13, const14, _b15 = fields
         # Be robust to stray NULs (rare)
-        if b"\x00" in name_b:
-            name_b = name_b.split(b"\x00", 1)[0]
-        name = name_b.decode('ascii','ignore').rstrip(' ')
-        attrs = chunk[NAME_LEN:]
-        body_type = attrs[0]
-        unk8      = attrs[2]
-        arm       = attrs[3]
-        speed     = attrs[4]
-        hit       = attrs[5]
-        pi        = attrs[6]
-        const14   = attrs[8]
+        name = name_b.split(b"\x00", 1)[0].decode('ascii','ignore').rstrip(' ')
         return Player(name, body_type, unk8, arm, speed, hit, pi, const14, offset)
 
     def _parse_team(self) -> None:
-        self.players.clear()
-        cursor = self.start
-        while cursor + ROW_LEN <= len(self.buf):
-            row = self.buf[cursor:cursor+ROW_LEN]
-            if all(b == 0xFF for b in row):
-                break
-            p = self._parse_player(row, cursor)
-            if not p:
-                break
-            self.players.append(p)
-            cursor += ROW_LEN
-
-    def _find_ff_line_after_team(self) -> Optional[int]:
-        cursor = self.start
-        for _ in range(0x800 // 16):
-            if cursor + 16 > len(self.buf):
-                return None
-            line = self.buf[cursor:cursor+16]
-            if all(b == 0xFF for b in line):
-                return cursor
-            cursor += 16
-        return None
+        end = self._ff_line
+        if end is None:
+            # No terminator: every whole row up to EOF
+            end = self.start + max(0, len(self.buf) - self.start) // ROW_LEN * ROW_LEN
+        # Unpack the whole roster block in one pass
+        self.players = [
+            self._parse_player(fields, self.start + i * ROW_LEN)
+            for i, fields in enumerate(_ROW_STRUCT.iter_unpack(self._mv[self.start:end]))
+        ]
+
+    def _find_ff_line_after_team(self, window: int = 0x800) -> Optional[int]:
+        limit = self.start + window
+        idx = self.buf.find(_FF16, self.start, limit)
+        while idx != -1 and (idx - self.start) % ROW_LEN:
+            # Hit straddles two rows (FF tail + FF row); resume at the next row boundary
+            idx = self.buf.find(_FF16, idx + ROW_LEN - (idx - self.start) % ROW_LEN, limit)
+        return None if idx == -1 else idx
 
     def _parse_profiles(self) -> None:
-        self.profiles.clear()
-        ff_line = self._find_ff_line_after_team()
-        if ff_line is None:
+        self.profiles = []
+        ff_line = self._ff_line
+        if ff_line is None or ff_line - self.start >= 0x800:   # profiles only follow a nearby terminator
             return
         base = ff_line + 16
         if base + 32 > len(self.buf):
             return
-        row1 = self.buf[base: base+16]
-        row2 = self.buf[base+16: base+32]
-        p1 = bytearray(row1[8:16]); p1_off = base + 8
-        p2 = bytearray(row2[0:8]);  p2_off = base + 16
-        p3 = bytearray(row2[8:16]); p3_off = base + 24
-        self.profiles = [PitchProfile(p1_off,p1), PitchProfile(p2_off,p2), PitchProfile(p3_off,p3)]
+        # Profiles #1..#3 sit back to back at base+8, base+16, base+24
+        self.profiles = [PitchProfile(base + o, bytearray(self._mv[base + o:base + o + 8]))
+                         for o in (8, 16, 24)]
 
     # --- Team colors ---
-    def read_team_colors(self, team_name: str) -> Optional[Tuple[int,int]]:
-        off = TEAM_OFFSETS_COLOUR.get(team_name)
-        if off is None or off + 1 >= len(self.buf): return None
+    def read_team_colors(self, team_idx: int) -> Optional[Tuple[int,int]]:
+        off = _COLOR_OFF[team_idx]
+        if off + 1 >= len(self.buf): return None
         return self.buf[off], self.buf[off+1]
 
-    def write_team_colors(self, team_name: str, primary_idx: int, secondary_idx: int) -> None:
-        off = TEAM_OFFSETS_COLOUR.get(team_name)
-        if off is None or off + 1 >= len(self.buf): return
-        self.buf[off]   = primary_idx & 0xFF
-        self.buf[off+1] = secondary_idx & 0xFF
+    def write_team_colors(self, team_idx: int, primary_idx: int, secondary_idx: int) -> None:
+        off = _COLOR_OFF[team_idx]
+        if off + 1 >= len(self.buf): return
+        self._store(off, bytes((primary_idx & 0xFF, secondary_idx & 0xFF)))
 
     # --- Lineup read/write (order→position) ---
-    def get_positions_by_order(self, team_name: str) -> Optional[list[int]]:
+    def get_positions_by_order(self, team_idx: int) -> Optional[list[int]]:
         """
         Return pos_by_order[0..8] where index 0 = batter #1, value is pos_idx 0..8.
         Uses the low nibble (pos_code) and sorts by the high nibble (order-1).
         """
-        addrs = TEAM_LINEUP_ADDRS.get(team_name)
-        if not addrs:
+        base = self._lineup_base(team_idx)
+        if base is None:
             return None
         pos_by_order = [0] * 9
-        for a in addrs:
-            if a >= len(self.buf):
-                return None
-            b = self.buf[a]
-            pos_idx, order = self.bcd_pos_order(b)
-            if 1 <= order <= 9:
-                pos_by_order[order - 1] = pos_idx
+        for b in self.buf[base:base + _LINEUP_LEN]:
+            order = (b >> 4) + 1
+            if order <= 9:
+                code = b & 0xF
+                pos_by_order[order - 1] = code - 1 if 1 <= code <= 9 else 0
         return pos_by_order
 
-    def write_lineup_positions_by_order(self, team_name: str, pos_by_order: list[int]) -> None:
+    def write_lineup_positions_by_order(self, team_idx: int, pos_by_order: list[int]) -> None:
         """
         Write back 9 bytes such that for the entry whose high nibble encodes order (o-1),
         the low nibble becomes (pos_idx+1) for that order o. Preserves address↔order mapping.
         """
-        addrs = TEAM_LINEUP_ADDRS.get(team_name)
-        if not addrs or len(pos_by_order) != 9:
+        base = self._lineup_base(team_idx)
+        if base is None or len(pos_by_order) != 9:
             return
-        for a in addrs:
-            if a >= len(self.buf):
-                continue
-            old_b = self.buf[a]
-            _pos_idx, order = self.bcd_pos_order(old_b)  # get order (1..9)
-            pos_idx = pos_by_order[max(1, min(9, order)) - 1]
-            self.buf[a] = self.make_bcd_pos_order(pos_idx, order)
+        out = bytearray(_LINEUP_LEN)
+        for i, old_b in enumerate(self.buf[base:base + _LINEUP_LEN]):
+            order = min(9, (old_b >> 4) + 1)  # keep this address's batting order
+            out[i] = self.make_bcd_pos_order(pos_by_order[order - 1], order)
+        self._store(base, out)
+
+    def _lineup_base(self, team_idx: int) -> Optional[int]:
+        base = _LINEUP_BASE + _LINEUP_LEN * team_idx
+        return base if base + _LINEUP_LEN <= len(self.buf) else None
 
     # --- Apply & Save ---
     def apply_players(self, players: List[Player]) -> None:
         """Write edited player rows back into buffer."""
         self.players = players
+        buf = self.buf
         for p in players:
-            row = bytearray(self.buf[p.row_offset:p.row_offset+ROW_LEN])
-            row[:NAME_LEN]   = self._encode_name6(p.name)
-            row[NAME_LEN+0]  = p.body_type   # byte6
-            row[NAME_LEN+1]  = 0xFF          # byte7 buffer
-            row[NAME_LEN+2]  = p.unk8        # byte8
-            row[NAME_LEN+3]  = p.arm         # byte9
-            row[NAME_LEN+4]  = p.speed       # byte10
-            row[NAME_LEN+5]  = max(0, min(4, p.hit))  # byte11
-            row[NAME_LEN+6]  = p.pi if p.pi in PI_CHOICES else 0x00  # byte12
-            # byte13 (buffer) preserved
-            row[NAME_LEN+8]  = p.const14     # byte14
-            # byte15 preserved
-            self.buf[p.row_offset:p.row_offset+ROW_LEN] = row
+            off = p.row_offset
+            # One packed row; bytes 13 and 15 (buffers) are carried over as-is
+            self._store(off, _ROW_STRUCT.pack(
+                _encode_name6(p.name),
+                p.body_type, 0xFF, p.unk8, p.arm, p.speed,        # bytes 6..10
+                min(4, max(0, p.hit)),                            # byte11
+                p.pi if p.pi in _PI_SET else 0x00,                # byte12
+                buf[off+13], p.const14, buf[off+15]))
 
     def apply_profiles(self, profiles: List[PitchProfile]) -> None:
         self.profiles = profiles
         for pr in profiles:
-            self.buf[pr.offset:pr.offset+8] = pr.raw
+            self._store(pr.offset, pr.raw)
+
+    def _store(self, off: int, data) -> None:
+        """Write data at off if it differs from the buffer, recording the span as dirty."""
+        end = off + len(data)
+        # Untouched bytes are left alone so their pages are never copied
+        if self.buf[off:end] != data:
+            self.buf[off:end] = data
+            self._dirty.append((off, end))
+
+    def dirty_spans(self) -> List[Tuple[int, int]]:
+        """Sorted (start, end) spans edited since load, with touching spans merged."""
+        spans: List[Tuple[int, int]] = []
+        for start, end in sorted(self._dirty):
+            if spans and start <= spans[-1][1]:
+                if end > spans[-1][1]:
+                    spans[-1] = (spans[-1][0], end)
+            else:
+                spans.append((start, end))
+        self._dirty = spans
+        return spans
 
     def save_rom(self, out_path: str):
-        with open(out_path,'wb') as f:
-            f.write(self.buf)
+        if not (os.path.exists(out_path) and os.path.samefile(out_path, self.rom_path)):
+            shutil.copyfile(self.rom_path, out_path)
+        elif isinstance(self.orig, mmap.mmap):
+            # The file is about to change under the read-only mapping; keep the
+            # as-loaded bytes so later IPS patches are still made against them
+            pristine = self.orig[:]
+            self.orig.close()
+            self.orig = pristine
+        # Only the edited spans are written. 'r+b' never truncates, so the ROM
+        # can be patched in place while it is still mapped.
+        with open(out_path, 'r+b') as f:
+            for start, end in self.dirty_spans():
+                f.seek(start)
+                f.write(self._mv[start:end])
+
+# ---- Diff helpers ----
+_IPS_RECORD = struct.Struct(">BHH")   # 24-bit offset (high byte + low word), 16-bit size
+
+def diff_runs(orig, edited, n: int) -> List[Tuple[int, int]]:
+    """
+    Return (start, end) spans where the first n bytes of orig and edited differ.
+    Uses one vectorised compare when NumPy is available, else a word-stepping loop.
+    """
+    if np is not None:
+        mask = np.frombuffer(orig, dtype=np.uint8, count=n) != np.frombuffer(edited, dtype=np.uint8, count=n)
+        # Rising/falling edges of the padded mask are run starts/ends
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False])).view(np.int8)))
+        return list(zip(edges[0::2].tolist(), edges[1::2].tolist()))
+    o, e = orig, edited   # bytes/mmap index and slice directly; memoryview only adds overhead
+    runs = []
+    i = 0
+    while i < n:
+        # Identical regions are the common case: skip them a word at a time
+        if i + 8 <= n and o[i:i+8] == e[i:i+8]:
+            i += 8
+            continue
+        if o[i] == e[i]:
+            i += 1
+            continue
+        start = i
+        while i < n and o[i] != e[i]:
+            i += 1
+        runs.append((start, i))
+    return runs
 
 # ---- UI helpers ----
-def hsv_string_to_qcolor(s: str) -> QColor:
-    try:
-        h_str, s_str, v_str = s.split(',')
-        h = int(float(h_str)) % 360
-        sat = max(0, min(255, int(float(s_str))))
-        val = max(0, min(255, int(float(v_str))))
-        return QColor.fromHsv(h, sat, val)
-    except Exception:
-        return QColor(0,0,0)
+# Palette entries are constant, so build their colours once at import
+_BLACK = QColor(0,0,0)
+PALETTE_QCOLORS = [QColor.fromHsv(*LLB_COLOR_PALETTE_MAP[idx]) for idx in range(0x40)]
 
 def make_swatch(color: QColor, w: int = 36, h: int = 16) -> QFrame:
     f = QFrame()
@@ -394,13 +480,110 @@ def make_swatch(color: QColor, w: int = 36, h: int = 16) -> QFrame:
     f.setPalette(pal)
     return f
 
+@contextmanager
+def bulk_update(table: QTableWidget):
+    """Suspend sorting, signals and repaints while a table is refilled."""
+    sorting = table.isSortingEnabled()
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(sorting)
+
+def make_choice_model(choices, parent=None) -> QStandardItemModel:
+    """Item model for a combo box from (text, data) pairs; one model can back many combos."""
+    model = QStandardItemModel(parent)
+    for text, data in choices:
+        item = QStandardItem(text)
+        item.setData(data, Qt.UserRole)
+        model.appendRow(item)
+    return model
+
+def hex_choices(values) -> list:
+    return [(f"0x{v:02X}", v) for v in values]
+
+def sync_rows(table: QTableWidget, items: List[list], n: int) -> List[list]:
+    """Resize table to n rows, keeping existing cells and creating items only for new rows."""
+    table.setRowCount(n)
+    del items[n:]   # setRowCount already deleted the items of dropped rows
+    for r in range(len(items), n):
+        row = [QTableWidgetItem() for _ in range(table.columnCount())]
+        for c, item in enumerate(row):
+            table.setItem(r, c, item)
+        items.append(row)
+    return items
+
+def set_choice(item: QTableWidgetItem, text: str, value) -> None:
+    """Show text and hold its value in Qt.UserRole (edited by ChoiceDelegate)."""
+    item.setData(Qt.UserRole, value)
+    item.setText(text)
+
+def set_number(item: QTableWidgetItem, value: int) -> None:
+    """Hold an int in Qt.EditRole (edited by SpinDelegate)."""
+    item.setData(Qt.EditRole, int(value))
+
+class ChoiceDelegate(QStyledItemDelegate):
+    """Combo-box editor for a column, created only while a cell is being edited."""
+    def __init__(self, choices, parent=None):
+        super().__init__(parent)
+        self._choices = list(choices)
+        self._model = make_choice_model(self._choices, self)   # shared by every editor
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.setModel(self._model)
+        return combo
+
+    def setEditorData(self, editor, index):
+        value = index.data(Qt.UserRole)
+        i = editor.findData(value)
+        if i == -1:
+            # Unlisted ROM value: private model so the shared one stays clean
+            editor.setModel(make_choice_model([(index.data(Qt.DisplayRole), value)] + self._choices, editor))
+            i = 0
+        editor.setCurrentIndex(i)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentData(), Qt.UserRole)
+        model.setData(index, editor.currentText(), Qt.DisplayRole)
+
+class SpinDelegate(QStyledItemDelegate):
+    """Spin-box editor bounded to [lo, hi], created only while a cell is being edited."""
+    def __init__(self, lo: int, hi: int, parent=None):
+        super().__init__(parent)
+        self.lo, self.hi = lo, hi
+
+    def createEditor(self, parent, option, index):
+        spin = QSpinBox(parent)
+        spin.setRange(self.lo, self.hi)
+        return spin
+
+    def setEditorData(self, editor, index):
+        editor.setValue(int(index.data(Qt.EditRole) or 0))
+
+    def setModelData(self, editor, model, index):
+        editor.interpretText()
+        model.setData(index, editor.value(), Qt.EditRole)
+
 # ---- UI ----
 class EditorUI(QWidget):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("LLB Roster & Team Color Editor")
         self.model: Optional[RosterModel] = None
-        self.loaded_team: Optional[str] = None
+        self.loaded_team_idx: Optional[int] = None
+        # Cells created by the populate_* methods, kept for harvesting
+        # Cell grids reused across loads; the flags say whether they hold the current team
+        self._roster_items: List[list] = []
+        self._pitch_items: List[list] = []
+        self._roster_filled = False
+        self._pitch_filled = False
+        self._edited = False   # set by any user edit since the team was loaded
+        self._lineup_combos: List[QComboBox] = []
         self._build()
 
     def _build(self):
@@ -422,24 +605,43 @@ class EditorUI(QWidget):
         self.tabs = QTabWidget()
 
         # Roster tab
-        roster_wrap = QWidget(); roster_v = QVBoxLayout(roster_wrap)
+        self.roster_tab = QWidget(); roster_v = QVBoxLayout(self.roster_tab)
         self.roster_table = QTableWidget(0, 9)
         self.roster_table.setHorizontalHeaderLabels([
             "Name", "Bat Side", "Body Size",
             "HIT (0-4)", "PI (08/10/18)", "RUN SPD",
             "ARM POWER", "UNK8", "Const14"
         ])
+        # Cells hold plain values; editors exist only while a cell is edited
+        rt = self.roster_table
+        rt.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        rt.setItemDelegateForColumn(1, ChoiceDelegate([(t, t) for t in ("Right", "Left")], rt))
+        rt.setItemDelegateForColumn(2, ChoiceDelegate([(t, t) for t in ("Tall", "Fat", "Short")], rt))
+        rt.setItemDelegateForColumn(3, SpinDelegate(0, 4, rt))
+        rt.setItemDelegateForColumn(4, ChoiceDelegate(hex_choices(PI_CHOICES), rt))
+        for col in (5, 6, 7):
+            rt.setItemDelegateForColumn(col, SpinDelegate(0, 255, rt))
+        rt.setItemDelegateForColumn(8, ChoiceDelegate(hex_choices(CONST14_CHOICES), rt))
         roster_v.addWidget(self.roster_table)
         self.apply_roster_btn = QPushButton("Apply Roster to Buffer")
         self.apply_roster_btn.clicked.connect(self.on_apply_roster)
         roster_v.addWidget(self.apply_roster_btn)
 
         # Pitching tab
-        pitching_wrap = QWidget(); pitch_v = QVBoxLayout(pitching_wrap)
+        self.pitching_tab = QWidget(); pitch_v = QVBoxLayout(self.pitching_tab)
         self.pitch_table = QTableWidget(3, 8)
         self.pitch_table.setHorizontalHeaderLabels([
             "Profile #", "Hand", "Delivery", "Stamina", "Quality", "Tune", "Skill(0-4)", "Mult"
         ])
+        pt = self.pitch_table
+        pt.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        pt.setItemDelegateForColumn(1, ChoiceDelegate([(t, h) for h, t in HAND_LABELS.items()], pt))
+        pt.setItemDelegateForColumn(2, ChoiceDelegate([(t, d) for d, t in DELIVERY_FROM_CODE.items()], pt))
+        pt.setItemDelegateForColumn(3, SpinDelegate(0, 255, pt))
+        pt.setItemDelegateForColumn(4, SpinDelegate(0, 255, pt))
+        pt.setItemDelegateForColumn(5, SpinDelegate(0, 15, pt))
+        pt.setItemDelegateForColumn(6, SpinDelegate(0, 4, pt))
+        pt.setItemDelegateForColumn(7, ChoiceDelegate(hex_choices(MULT_CHOICES), pt))
         pitch_v.addWidget(self.pitch_table)
         self.apply_pitch_btn = QPushButton("Apply Pitching to Buffer")
         self.apply_pitch_btn.clicked.connect(self.on_apply_pitching)
@@ -454,35 +656,42 @@ class EditorUI(QWidget):
         self.primary_combo = QComboBox()
         for idx in sorted(LLB_COLOR_PALETTE_MAP.keys()):
             self.primary_combo.addItem(f"0x{idx:02X}", idx)
-        self.primary_swatch = make_swatch(QColor(0,0,0))
+        self.primary_swatch = make_swatch(_BLACK)
         row1.addWidget(self.primary_combo); row1.addWidget(self.primary_swatch)
         row2.addWidget(QLabel("Secondary:"))
         self.secondary_combo = QComboBox()
         for idx in sorted(LLB_COLOR_PALETTE_MAP.keys()):
             self.secondary_combo.addItem(f"0x{idx:02X}", idx)
-        self.secondary_swatch = make_swatch(QColor(0,0,0))
+        self.secondary_swatch = make_swatch(_BLACK)
         row2.addWidget(self.secondary_combo); row2.addWidget(self.secondary_swatch)
         colors_layout.addLayout(row1); colors_layout.addLayout(row2)
         self.apply_colors_btn = QPushButton("Apply Team Colors to Buffer")
         self.apply_colors_btn.clicked.connect(self.on_apply_colors)
         colors_layout.addWidget(self.apply_colors_btn)
-        # Live preview auto-writes to buffer
+        # Live swatch preview; colors are written to the buffer on apply/save
         self.primary_combo.currentIndexChanged.connect(self.on_palette_changed)
         self.secondary_combo.currentIndexChanged.connect(self.on_palette_changed)
+        self.primary_combo.currentIndexChanged.connect(self.mark_edited)
+        self.secondary_combo.currentIndexChanged.connect(self.mark_edited)
 
         # Lineup tab (order → position)
         self.lineup_tab = QWidget(); lu_v = QVBoxLayout(self.lineup_tab)
         self.lineup_table = QTableWidget(9, 2)
         self.lineup_table.setHorizontalHeaderLabels(["Batting Order", "Position"])
         lu_v.addWidget(self.lineup_table)
+        self._pos_model = make_choice_model(list(zip(POS_LIST, range(len(POS_LIST)))), self)
         self.apply_lineup_btn = QPushButton("Apply Lineup to Buffer")
         self.apply_lineup_btn.clicked.connect(self.on_apply_lineup)
         lu_v.addWidget(self.apply_lineup_btn)
 
-        self.tabs.addTab(roster_wrap, "Roster")
-        self.tabs.addTab(pitching_wrap, "Pitching")
+        self.tabs.addTab(self.roster_tab, "Roster")
+        self.tabs.addTab(self.pitching_tab, "Pitching")
         self.tabs.addTab(self.colors_tab, "Team Colors")
         self.tabs.addTab(self.lineup_tab, "Lineup")
+        self.tabs.currentChanged.connect(self.on_tab_changed)
+        # Table refills run under bulk_update, so only user edits reach these
+        self.roster_table.itemChanged.connect(self.mark_edited)
+        self.pitch_table.itemChanged.connect(self.mark_edited)
         root.addWidget(self.tabs)
 
         bottom = QHBoxLayout()
@@ -504,74 +713,86 @@ class EditorUI(QWidget):
             QMessageBox.warning(self, "Load", "Choose a valid ROM file.")
             return
         team = self.team_combo.currentText()
-        start = TEAM_OFFSETS.get(team)
-        if start is None:
+        team_idx = _TEAM_INDEX.get(team)
+        if team_idx is None:
             QMessageBox.information(self, "Offset needed",
                                     f"Offset for '{team}' is not set yet.")
             return
         try:
-            self.model = RosterModel(rom, start)
-            self.loaded_team = team
+            model = RosterModel(rom, _ROSTER_START[team_idx])
         except Exception as e:
             QMessageBox.critical(self, "Load", str(e))
             return
-        self.populate_roster()
-        self.populate_pitching()
+        if self.model:
+            self.model.close()
+        self.model = model
+        self.loaded_team_idx = team_idx
+        # Roster and pitching tables fill the first time their tab is shown
+        self._roster_filled = self._pitch_filled = False
+        self.on_tab_changed(self.tabs.currentIndex())
         self.populate_colors()
         self.populate_lineup()
+        self._edited = False
+
+    def mark_edited(self, *_):
+        self._edited = True
+
+    def on_tab_changed(self, index: int):
+        if not self.model:
+            return
+        tab = self.tabs.widget(index)
+        if tab is self.roster_tab and not self._roster_filled:
+            self.populate_roster()
+        elif tab is self.pitching_tab and not self._pitch_filled:
+            self.populate_pitching()
 
     # --- Populate tabs ---
     def populate_roster(self):
-        self.roster_table.setRowCount(len(self.model.players))
-        for r,p in enumerate(self.model.players):
-            self.roster_table.setItem(r,0,QTableWidgetItem(p.name))
-            is_left = bool(p.body_type & 0x80)
-            size = SIZE_FROM_CODE.get(p.body_type & 0x03, "Tall")
-            bat_c  = QComboBox(); bat_c.addItems(["Right","Left"]) ; bat_c.setCurrentText("Left" if is_left else "Right")
-            size_c = QComboBox(); size_c.addItems(["Tall","Fat","Short"]) ; size_c.setCurrentText(size)
-            self.roster_table.setCellWidget(r,1,bat_c)
-            self.roster_table.setCellWidget(r,2,size_c)
-            hit = QSpinBox(); hit.setRange(0,4); hit.setValue(p.hit)
-            self.roster_table.setCellWidget(r,3,hit)
-            pi = QComboBox(); [pi.addItem(f"0x{v:02X}", v) for v in PI_CHOICES]
-            pi.setCurrentIndex(max(0, PI_CHOICES.index(p.pi) if p.pi in PI_CHOICES else 0))
-            self.roster_table.setCellWidget(r,4,pi)
-            spd = QSpinBox(); spd.setRange(0,255); spd.setValue(p.speed)
-            self.roster_table.setCellWidget(r,5,spd)
-            arm = QSpinBox(); arm.setRange(0,255); arm.setValue(p.arm)
-            self.roster_table.setCellWidget(r,6,arm)
-            unk8 = QSpinBox(); unk8.setRange(0,255); unk8.setValue(p.unk8)
-            self.roster_table.setCellWidget(r,7,unk8)
-            c14 = QComboBox(); [c14.addItem(f"0x{v:02X}", v) for v in CONST14_CHOICES]
-            if p.const14 not in CONST14_CHOICES:
-                c14.insertItem(0, f"0x{p.const14:02X}", p.const14); c14.setCurrentIndex(0)
-            else:
-                c14.setCurrentIndex(CONST14_CHOICES.index(p.const14))
-            self.roster_table.setCellWidget(r,8,c14)
+        rt = self.roster_table
+        players = self.model.players
+        with bulk_update(rt):
+            # [row][col] grid read back by harvest_players
+            items = sync_rows(rt, self._roster_items, len(players))
+            for cells, p in zip(items, players):
+                bat  = "Left" if p.body_type & 0x80 else "Right"
+                size = SIZE_FROM_CODE.get(p.body_type & 0x03, "Tall")
+                cells[0].setText(p.name)
+                set_choice(cells[1], bat, bat)
+                set_choice(cells[2], size, size)
+                set_number(cells[3], min(p.hit, 4))
+                set_choice(cells[4], f"0x{p.pi:02X}", p.pi)
+                set_number(cells[5], p.speed)
+                set_number(cells[6], p.arm)
+                set_number(cells[7], p.unk8)
+                set_choice(cells[8], f"0x{p.const14:02X}", p.const14)
+        self._roster_filled = True
 
     def populate_pitching(self):
-        self.pitch_table.setRowCount(len(self.model.profiles) if self.model.profiles else 3)
-        for i, pr in enumerate(self.model.profiles):
-            self.pitch_table.setItem(i, 0, QTableWidgetItem(str(i+1)))
-            hand = QComboBox(); hand.addItems(["Right","Left"]) ; hand.setCurrentText(pr.hand)
-            self.pitch_table.setCellWidget(i,1,hand)
-            delv = QComboBox(); delv.addItems(["Normal","Hard","Sidearm"]) ; delv.setCurrentText(pr.delivery)
-            self.pitch_table.setCellWidget(i,2,delv)
-            st  = QSpinBox(); st.setRange(0,255); st.setValue(pr.stamina)
-            ql  = QSpinBox(); ql.setRange(0,255); ql.setValue(pr.quality)
-            tn  = QSpinBox(); tn.setRange(0,15);  tn.setValue(pr.tune)
-            sk  = QSpinBox(); sk.setRange(0,4);   sk.setValue(pr.skill)
-            mu  = QComboBox(); [mu.addItem(f"0x{v:02X}", v) for v in [0x00,0x02]] ; mu.setCurrentIndex(0 if pr.mult==0 else 1)
-            self.pitch_table.setCellWidget(i,3,st)
-            self.pitch_table.setCellWidget(i,4,ql)
-            self.pitch_table.setCellWidget(i,5,tn)
-            self.pitch_table.setCellWidget(i,6,sk)
-            self.pitch_table.setCellWidget(i,7,mu)
+        pt = self.pitch_table
+        profiles = self.model.profiles
+        with bulk_update(pt):
+            # [row][col] grid read back by harvest_profiles
+            items = sync_rows(pt, self._pitch_items, len(profiles))
+            if not profiles:
+                pt.setRowCount(3)   # blank placeholder rows
+            for i, (cells, pr) in enumerate(zip(items, profiles)):
+                num = cells[0]
+                num.setText(str(i+1)); num.setFlags(num.flags() & ~Qt.ItemIsEditable)
+                mult = MULT_CHOICES[0 if pr.mult == 0 else 1]
+                delv = pr.delivery
+                set_choice(cells[1], HAND_LABELS[pr.hand], pr.hand)
+                set_choice(cells[2], DELIVERY_FROM_CODE.get(delv, f"0x{delv:02X}"), delv)
+                set_number(cells[3], pr.stamina)
+                set_number(cells[4], pr.quality)
+                set_number(cells[5], min(pr.tune, 15))
+                set_number(cells[6], min(pr.skill, 4))
+                set_choice(cells[7], f"0x{mult:02X}", mult)
+        self._pitch_filled = True
 
     def populate_colors(self):
-        if not (self.model and self.loaded_team):
+        if not self.model or self.loaded_team_idx is None:
             return
-        current = self.model.read_team_colors(self.loaded_team)
+        current = self.model.read_team_colors(self.loaded_team_idx)
         if current:
             prim, sec = current
             i1 = self.primary_combo.findData(prim)
@@ -583,127 +804,116 @@ class EditorUI(QWidget):
         self.on_palette_changed()
 
     def on_palette_changed(self, *_):
-        try:
-            p_idx = self.primary_combo.currentData()
-            s_idx = self.secondary_combo.currentData()
-        except Exception:
-            return
-        p_col = hsv_string_to_qcolor(LLB_COLOR_PALETTE_MAP.get(p_idx, "0,0,0"))
-        s_col = hsv_string_to_qcolor(LLB_COLOR_PALETTE_MAP.get(s_idx, "0,0,0"))
+        p_col = PALETTE_QCOLORS[self.primary_combo.currentData()]
+        s_col = PALETTE_QCOLORS[self.secondary_combo.currentData()]
         for frame, col in ((self.primary_swatch, p_col), (self.secondary_swatch, s_col)):
             pal = frame.palette()
             pal.setColor(QPalette.Window, col)
             frame.setPalette(pal)
-        if self.model and self.loaded_team and p_idx is not None and s_idx is not None:
-            self.model.write_team_colors(self.loaded_team, int(p_idx), int(s_idx))
 
     def populate_lineup(self):
         """Show 9 rows: Batting Order (1..9) with a Position dropdown for each slot."""
         self.lineup_table.setRowCount(9)
+        self._lineup_combos = []
         for order_idx in range(9):
             self.lineup_table.setItem(order_idx, 0, QTableWidgetItem(str(order_idx + 1)))
             combo = QComboBox()
-            for pos_idx, label in enumerate(POS_LIST):
-                combo.addItem(label, pos_idx)  # data = 0..8
+            combo.setModel(self._pos_model)  # data = 0..8
+            combo.currentIndexChanged.connect(self.mark_edited)
             self.lineup_table.setCellWidget(order_idx, 1, combo)
-        if self.loaded_team:
-            pos_by_order = self.model.get_positions_by_order(self.loaded_team)
+            self._lineup_combos.append(combo)
+        if self.loaded_team_idx is not None:
+            pos_by_order = self.model.get_positions_by_order(self.loaded_team_idx)
             if pos_by_order:
-                for order_idx in range(9):
-                    w = self.lineup_table.cellWidget(order_idx, 1)
-                    target_pos = int(pos_by_order[order_idx])
-                    idx = w.findData(target_pos) if hasattr(w, "findData") else target_pos
+                for w, target_pos in zip(self._lineup_combos, pos_by_order):
+                    idx = w.findData(int(target_pos))
                     if 0 <= idx < w.count():
                         w.setCurrentIndex(idx)
 
     # ---------- Harvest current UI state ----------
     def harvest_players(self):
         out = []
-        for r, p in enumerate(self.model.players):
-            name = self.roster_table.item(r, 0).text() if self.roster_table.item(r, 0) else p.name
-            bat  = self.roster_table.cellWidget(r, 1).currentText()
-            size = self.roster_table.cellWidget(r, 2).currentText()
-            hit  = self.roster_table.cellWidget(r, 3).value()
-            piw  = self.roster_table.cellWidget(r, 4);  pi = piw.currentData() if hasattr(piw, 'currentData') else p.pi
-            spd  = self.roster_table.cellWidget(r, 5).value()
-            arm  = self.roster_table.cellWidget(r, 6).value()
-            unk8 = self.roster_table.cellWidget(r, 7).value()
-            c14w = self.roster_table.cellWidget(r, 8);  const14 = c14w.currentData() if hasattr(c14w, 'currentData') else p.const14
-            body_code = CODE_FROM_SIZE.get(size, 0)
-            if bat == "Left":
-                body_code |= 0x80
+        for p, cells in zip(self.model.players, self._roster_items):
+            name    = cells[0].text()
+            bat     = cells[1].data(Qt.UserRole)
+            size    = cells[2].data(Qt.UserRole)
+            hit     = cells[3].data(Qt.EditRole)
+            pi      = cells[4].data(Qt.UserRole)
+            spd     = cells[5].data(Qt.EditRole)
+            arm     = cells[6].data(Qt.EditRole)
+            unk8    = cells[7].data(Qt.EditRole)
+            const14 = cells[8].data(Qt.UserRole)
+            body_code = _BODY_CODE.get((bat, size), 0)
             out.append(Player(name, body_code, unk8, arm, spd, hit, pi, const14, p.row_offset))
         return out
 
     def harvest_profiles(self):
         out = []
-        for i, pr in enumerate(self.model.profiles):
-            hand = self.pitch_table.cellWidget(i, 1).currentText()
-            delv = self.pitch_table.cellWidget(i, 2).currentText()
-            st   = self.pitch_table.cellWidget(i, 3).value()
-            ql   = self.pitch_table.cellWidget(i, 4).value()
-            tn   = self.pitch_table.cellWidget(i, 5).value()
-            sk   = self.pitch_table.cellWidget(i, 6).value()
-            muw  = self.pitch_table.cellWidget(i, 7);  mu = muw.currentData() if hasattr(muw, 'currentData') else pr.mult
-            new = PitchProfile(pr.offset, bytearray(pr.raw))
-            new.hand = hand; new.delivery = delv
-            new.stamina = st; new.quality = ql; new.tune = tn
-            new.skill = sk; new.mult = mu
-            out.append(new)
+        for pr, cells in zip(self.model.profiles, self._pitch_items):
+            hand = cells[1].data(Qt.UserRole)
+            delv = cells[2].data(Qt.UserRole)
+            st   = cells[3].data(Qt.EditRole)
+            ql   = cells[4].data(Qt.EditRole)
+            tn   = cells[5].data(Qt.EditRole)
+            sk   = cells[6].data(Qt.EditRole)
+            mu   = cells[7].data(Qt.UserRole)
+            # Editor ranges already bound the values; rebuild the bytes directly
+            raw = bytearray(pr.raw)
+            raw[0] = (raw[0] & 0x70) | hand | delv
+            raw[1] = st; raw[2] = ql; raw[3] = tn & 0x0F
+            raw[6] = sk; raw[7] = mu & 0xFF
+            out.append(PitchProfile(pr.offset, raw))
         return out
 
     def harvest_lineup(self):
         """Return pos_by_order[0..8] (positions for batting orders 1..9)."""
-        if not self.loaded_team:
+        if self.loaded_team_idx is None:
             return None
         pos_by_order = [0] * 9
-        for order_idx in range(9):
-            w = self.lineup_table.cellWidget(order_idx, 1)
-            pos = w.currentData() if hasattr(w, "currentData") else None
+        for order_idx, w in enumerate(self._lineup_combos):
+            pos = w.currentData()
             if pos is None:
-                try:
-                    pos = POS_TO_IDX[w.currentText()]
-                except Exception:
-                    pos = 0
+                pos = POS_TO_IDX.get(w.currentText(), 0)
             pos_by_order[order_idx] = max(0, min(8, int(pos)))
         return pos_by_order
 
     # ---------- Apply-to-buffer buttons ----------
     def on_apply_roster(self):
-        if not self.model:
+        if not (self.model and self._roster_filled):   # tab never shown: nothing edited
             return
         self.model.apply_players(self.harvest_players())
 
     def on_apply_pitching(self):
-        if not self.model:
+        if not (self.model and self._pitch_filled):
             return
         self.model.apply_profiles(self.harvest_profiles())
 
     def on_apply_colors(self):
-        if not (self.model and self.loaded_team):
+        if not self.model or self.loaded_team_idx is None:
             return
         try:
             prim_idx = self.primary_combo.currentData()
             sec_idx  = self.secondary_combo.currentData()
             if prim_idx is not None and sec_idx is not None:
-                self.model.write_team_colors(self.loaded_team, int(prim_idx), int(sec_idx))
+                self.model.write_team_colors(self.loaded_team_idx, int(prim_idx), int(sec_idx))
         except Exception:
             pass
 
     def on_apply_lineup(self):
-        if not (self.model and self.loaded_team):
+        if not self.model or self.loaded_team_idx is None:
             return
         pos_by_order = self.harvest_lineup()
         if pos_by_order:
-            self.model.write_lineup_positions_by_order(self.loaded_team, pos_by_order)
+            self.model.write_lineup_positions_by_order(self.loaded_team_idx, pos_by_order)
 
     # ---------- Save ROM / IPS ----------
     def on_save(self):
         if not self.model:
             QMessageBox.information(self, "Save", "Load a team first.")
             return
-        # Apply all tabs to buffer first
-        self.on_apply_roster(); self.on_apply_pitching(); self.on_apply_colors(); self.on_apply_lineup()
+        # Apply all tabs to buffer first (nothing to apply if nothing was touched)
+        if self._edited:
+            self.on_apply_roster(); self.on_apply_pitching(); self.on_apply_colors(); self.on_apply_lineup()
         path, _ = QFileDialog.getSaveFileName(self, "Save", os.getcwd(), "NES ROM (*.nes)")
         if path:
             self.model.save_rom(path)
@@ -712,36 +922,51 @@ class EditorUI(QWidget):
         if not self.model:
             QMessageBox.information(self, "Patch", "Load a team first.")
             return
-        with open(self.model.rom_path, 'rb') as f:
-            orig = f.read()
         # Apply all tabs to buffer before diffing
-        self.on_apply_roster(); self.on_apply_pitching(); self.on_apply_colors(); self.on_apply_lineup()
-        ips = self._build_ips(orig, bytes(self.model.buf))
+        if self._edited:
+            self.on_apply_roster(); self.on_apply_pitching(); self.on_apply_colors(); self.on_apply_lineup()
+        spans = self.model.dirty_spans()
+        if not spans:
+            QMessageBox.information(self, "Patch", "No changes to patch.")
+            return
+        ips = self._build_ips(self.model.orig, self.model.buf, spans)
         path, _ = QFileDialog.getSaveFileName(self, "Save IPS Patch", os.getcwd(), "IPS Patch (*.ips)")
         if path:
             with open(path, 'wb') as f:
                 f.write(ips)
 
+    def closeEvent(self, event):
+        if self.model:
+            self.model.close()
+            self.model = None
+        super().closeEvent(event)
+
     @staticmethod
-    def _build_ips(orig: bytes, edited: bytes) -> bytes:
-        # Minimal IPS writer
+    def _build_ips(orig, edited, spans: Optional[List[Tuple[int, int]]] = None) -> bytes:
+        # Minimal IPS writer; orig/edited may be any sliceable buffer (bytes, mmap).
+        # spans, if given, are the only ranges that can differ (the model's dirty spans).
         n = min(len(orig), len(edited))
-        o = memoryview(orig)[:n]; e = memoryview(edited)[:n]
-        def off3(x: int) -> bytes: return bytes([(x >> 16) & 0xFF, (x >> 8) & 0xFF, x & 0xFF])
-        out = bytearray(b"PATCH")
-        i = 0
-        while i < n:
-            if o[i] == e[i]:
-                i += 1
-                continue
-            start = i
-            while i < n and o[i] != e[i] and (i - start) < 65535:
-                i += 1
-            chunk = e[start:i].tobytes()
-            out += off3(start)
-            out += bytes([(len(chunk) >> 8) & 0xFF, len(chunk) & 0xFF])
-            out += chunk
-        out += b"EOF"
+        if spans is None:
+            runs = diff_runs(orig, edited, n)
+        else:
+            runs = []
+            for start, end in spans:
+                end = min(end, n)
+                if start < end:
+                    runs += [(start + a, start + b)
+                             for a, b in diff_runs(orig[start:end], edited[start:end], end - start)]
+        # IPS record sizes are 16-bit; split longer runs
+        records = [(s, min(end, s + 0xFFFF))
+                   for start, end in runs
+                   for s in range(start, end, 0xFFFF)]
+        out = bytearray(5 + sum(5 + e - s for s, e in records) + 3)
+        out[0:5] = b"PATCH"
+        pos = 5
+        for s, e in records:
+            _IPS_RECORD.pack_into(out, pos, s >> 16, s & 0xFFFF, e - s)
+            out[pos+5:pos+5+e-s] = edited[s:e]
+            pos += 5 + e - s
+        out[pos:] = b"EOF"
         return bytes(out)
 
 if __name__ == "__main__":